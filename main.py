@@ -1,15 +1,121 @@
-from abc import abstractmethod, ABCMeta
-from datetime import datetime
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from itertools import chain
 from random import randint
+from typing import TYPE_CHECKING, ClassVar, NamedTuple, NoReturn, Protocol, runtime_checkable
+import sys
+import time
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Transaction type codes stored in TxLog.types, indexing into TX_TYPE_NAMES.
+TX_OPENING: int = 0
+TX_DEPOSIT: int = 1
+TX_WITHDRAWAL: int = 2
+TX_TYPE_NAMES: tuple[str, ...] = ("Opening", "Deposit", "Withdrawal")
+
+
+class Transaction(NamedTuple):
+    """
+    A single transaction as returned by SavingsAccount.view_transaction_history.
+    """
+
+    type: str
+    amount: float
+    timestamp: datetime
+
+
+def to_datetime(timestamp: int) -> datetime:
+    """
+    Converts a transaction timestamp to a datetime for display.
+
+    Parameters:
+    - timestamp (int): The transaction time in nanoseconds since the epoch.
+
+    Returns:
+    - datetime: The corresponding local time.
+    """
+    # Imported here since datetime is only needed when history is displayed.
+    from datetime import datetime
+
+    # Integer arithmetic keeps the exact microsecond; timestamp / 1e9 can be off by one.
+    return datetime.fromtimestamp(timestamp // 1_000_000_000).replace(
+        microsecond=timestamp // 1000 % 1_000_000
+    )
+
+
+@dataclass
+class TxLog:
+    """
+    Columnar transaction log holding types, amounts and timestamps in parallel arrays.
+    """
+
+    types: array[int] = field(default_factory=lambda: array("b"))
+    amounts: array[float] = field(default_factory=lambda: array("d"))
+    timestamps: array[int] = field(default_factory=lambda: array("q"))
 
+    def __len__(self) -> int:
+        return len(self.types)
 
-class Account(metaclass=ABCMeta):
+    def append(self, type_code: int, amount: float, timestamp: int) -> None:
+        """
+        Appends a single transaction to the log.
+
+        Parameters:
+        - type_code (int): One of TX_OPENING, TX_DEPOSIT or TX_WITHDRAWAL.
+        - amount (float): The transaction amount.
+        - timestamp (int): The transaction time in nanoseconds since the epoch.
+        """
+        self.types.append(type_code)
+        self.amounts.append(amount)
+        self.timestamps.append(timestamp)
+
+    def extend(self, other: TxLog) -> None:
+        """
+        Appends all transactions from another log.
+
+        Parameters:
+        - other (TxLog): The log to copy transactions from.
+        """
+        # Timestamps are appended last, so their count excludes a record whose append was
+        # interrupted part-way; copying only that many keeps the columns aligned.
+        count = len(other.timestamps)
+        self.types.extend(other.types[:count])
+        self.amounts.extend(other.amounts[:count])
+        self.timestamps.extend(other.timestamps[:count])
+
+    def clear(self) -> None:
+        """
+        Removes all transactions from the log.
+        """
+        del self.types[:]
+        del self.amounts[:]
+        del self.timestamps[:]
+
+    def records(self, start: int = 0) -> Iterator[tuple[int, float, int]]:
+        """
+        Iterates over the transactions as (type_code, amount, timestamp) tuples.
+
+        Parameters:
+        - start (int): The index of the first transaction to include.
+        """
+        if start:
+            return zip(self.types[start:], self.amounts[start:], self.timestamps[start:])
+        return zip(self.types, self.amounts, self.timestamps)
+
+
+@runtime_checkable
+class Account(Protocol):
     """
-    Abstract base class representing a generic bank account.
+    Protocol describing the interface of a generic bank account.
     """
 
-    @abstractmethod
-    def open_new_account(self, name, initial_deposit):
+    def open_new_account(self, name: str, initial_deposit: float) -> int:
         """
         Opens a new bank account.
 
@@ -20,20 +126,18 @@ class Account(metaclass=ABCMeta):
         Returns:
         - int: The generated account number.
         """
-        pass
+        ...
 
-    @abstractmethod
-    def generate_account_number(self):
+    def generate_account_number(self) -> int:
         """
         Generates a unique account number.
 
         Returns:
         - int: The generated account number.
         """
-        pass
+        ...
 
-    @abstractmethod
-    def retrieve_account(self, account_number):
+    def retrieve_account(self, account_number: int) -> dict[str, object] | None:
         """
         Retrieves information about a specific account.
 
@@ -43,24 +147,70 @@ class Account(metaclass=ABCMeta):
         Returns:
         - dict or None: A dictionary containing account information, or None if the account is not found.
         """
-        pass
+        ...
 
 
-class SavingsAccount(Account):
+@dataclass(slots=True)
+class AccountRow:
     """
-    Concrete class representing a savings account, inheriting from the Account base class.
+    All state of a single savings account, stored together under its account number.
     """
 
-    def __init__(self):
+    name: str
+    balance: float
+    account_str: str
+    history: TxLog = field(default_factory=TxLog)
+    buffer: TxLog = field(default_factory=TxLog)
+    lines: list[str] = field(default_factory=list)
+
+
+class SavingsAccount:
+    """
+    Concrete class representing a savings account, implementing the Account protocol.
+    """
+
+    __slots__ = (
+        "_rows",
+        "_sorted_accts",
+        "_cur_row",
+        "_current_account_number",
+        "account_counter",
+    )
+
+    # Number of buffered transactions per account before they are flushed into the history.
+    _BUF_THRESHOLD: ClassVar[int] = 1000
+
+    _rows: dict[int, AccountRow]
+    _sorted_accts: list[int]
+    _cur_row: AccountRow | None
+    _current_account_number: int | None
+    account_counter: int
+
+    def __init__(self) -> None:
         """
         Initializes a new SavingsAccount instance with empty account and transaction history.
         """
-        self.savings_accounts = {}
-        self.transaction_history = {}
+        self._rows = {}
+        self._sorted_accts = []
+        self._cur_row = None
         self.current_account_number = None
         self.account_counter = randint(1000000000, 9999999999)
 
-    def open_new_account(self, name, initial_deposit):
+    @property
+    def current_account_number(self) -> int | None:
+        """
+        The account number of the logged-in account, or None if no account is logged in.
+        """
+        return self._current_account_number
+
+    @current_account_number.setter
+    def current_account_number(self, account_number: int | None) -> None:
+        # Bind the account's row once so deposits and withdrawals don't have to look it up
+        # on every transaction.
+        self._current_account_number = account_number
+        self._cur_row = self._rows.get(account_number) if account_number is not None else None
+
+    def open_new_account(self, name: str, initial_deposit: float) -> int:
         """
         Opens a new savings account.
 
@@ -72,22 +222,24 @@ class SavingsAccount(Account):
         - int: The generated account number.
         """
         account_number = self.generate_account_number()
-        self.savings_accounts[account_number] = {"name": name, "balance": initial_deposit}
-        self.transaction_history[account_number] = [
-            {"type": "Opening", "amount": initial_deposit, "timestamp": datetime.now()}
-        ]
+        row = AccountRow(name, initial_deposit, str(account_number))
+        row.history.append(TX_OPENING, initial_deposit, time.time_ns())
+        self._rows[account_number] = row
+        insort(self._sorted_accts, account_number)
         return account_number
 
-    def generate_account_number(self):
+    def generate_account_number(self) -> int:
         """
         Generates a unique account number.
 
         Returns:
         - int: The generated account number.
         """
-        return self.account_counter
+        account_number = self.account_counter
+        self.account_counter += 1
+        return account_number
 
-    def retrieve_account(self, account_number):
+    def retrieve_account(self, account_number: int) -> dict[str, object] | None:
         """
         Retrieves information about a specific savings account.
 
@@ -97,9 +249,42 @@ class SavingsAccount(Account):
         Returns:
         - dict or None: A dictionary containing account information, or None if the account is not found.
         """
-        return self.savings_accounts.get(account_number, None)
+        row = self._rows.get(account_number)
+        if row is None:
+            return None
+        return {"name": row.name, "balance": row.balance}
+
+    def format_account_number(self, account_number: int) -> str:
+        """
+        Formats an account number for display, reusing the string cached when the account was opened.
+
+        Parameters:
+        - account_number (int): The account number to format.
+
+        Returns:
+        - str: The account number as a decimal string.
+        """
+        row = self._rows.get(account_number)
+        if row is None:
+            return str(account_number)
+        return row.account_str
 
-    def deposit(self, amount_deposit):
+    def list_accounts(self, first_account_number: int, last_account_number: int) -> list[int]:
+        """
+        Lists the account numbers within a range.
+
+        Parameters:
+        - first_account_number (int): The lowest account number to include.
+        - last_account_number (int): The highest account number to include.
+
+        Returns:
+        - list: The matching account numbers in ascending order.
+        """
+        start = bisect_left(self._sorted_accts, first_account_number)
+        end = bisect_right(self._sorted_accts, last_account_number)
+        return self._sorted_accts[start:end]
+
+    def deposit(self, amount_deposit: float) -> bool:
         """
         Makes a deposit into the current savings account.
 
@@ -109,15 +294,14 @@ class SavingsAccount(Account):
         Returns:
         - bool: True if the deposit is successful, False otherwise.
         """
-        if self.current_account_number in self.savings_accounts:
-            self.savings_accounts[self.current_account_number]["balance"] += amount_deposit
-            self.transaction_history[self.current_account_number].append(
-                {"type": "Deposit", "amount": amount_deposit, "timestamp": datetime.now()}
-            )
-            return True
-        return False
-
-    def withdraw(self, amount_withdraw):
+        row = self._cur_row
+        if row is None:
+            return False
+        row.balance += amount_deposit
+        self._buffer_transaction(row, TX_DEPOSIT, amount_deposit)
+        return True
+
+    def withdraw(self, amount_withdraw: float) -> bool:
         """
         Makes a withdrawal from the current savings account.
 
@@ -127,129 +311,354 @@ class SavingsAccount(Account):
         Returns:
         - bool: True if the withdrawal is successful, False otherwise.
         """
-        if self.current_account_number in self.savings_accounts:
-            if self.savings_accounts[self.current_account_number]["balance"] >= amount_withdraw:
-                self.savings_accounts[self.current_account_number]["balance"] -= amount_withdraw
-                self.transaction_history[self.current_account_number].append(
-                    {"type": "Withdrawal", "amount": amount_withdraw, "timestamp": datetime.now()}
-                )
-                return True
-        return False
-
-    def view_account_balance(self):
+        row = self._cur_row
+        if row is None or row.balance < amount_withdraw:
+            return False
+        row.balance -= amount_withdraw
+        self._buffer_transaction(row, TX_WITHDRAWAL, amount_withdraw)
+        return True
+
+    def view_account_balance(self) -> float | None:
         """
         Views the current balance of the savings account.
 
         Returns:
         - float or None: The current balance, or None if there's an error fetching the balance.
         """
-        return self.savings_accounts.get(self.current_account_number, {}).get("balance", None)
+        row = self._cur_row
+        if row is None:
+            return None
+        return row.balance
 
-    def view_transaction_history(self):
+    def view_transaction_history(self) -> list[Transaction]:
         """
         Views the transaction history of the savings account.
 
+        Transactions are stored column-wise in TxLog arrays and only expanded into records here.
+
         Returns:
-        - list: A list of dictionaries representing transaction history.
+        - list: A list of Transaction tuples representing transaction history.
         """
-        return self.transaction_history.get(self.current_account_number, [])
+        row = self._cur_row
+        if row is None:
+            return []
+        return [
+            Transaction(TX_TYPE_NAMES[type_code], amount, to_datetime(timestamp))
+            for type_code, amount, timestamp in chain(row.history.records(), row.buffer.records())
+        ]
+
+    def view_transaction_lines(self) -> list[str]:
+        """
+        Views the transaction history of the savings account as display lines.
+
+        Returns:
+        - list: A list of strings, one "timestamp: type - $amount" line per transaction.
+        """
+        row = self._cur_row
+        if row is None:
+            return []
+        self._update_history_cache(row)
+        return list(row.lines)
+
+    @staticmethod
+    def _update_history_cache(row: AccountRow) -> None:
+        """
+        Formats an account's transactions made since the previous call into its cached display
+        lines. History is append-only, so each transaction is formatted once.
+
+        Parameters:
+        - row (AccountRow): The account to update.
+        """
+        history = row.history
+        done = len(row.lines)
+        new_records: Iterator[tuple[int, float, int]]
+        if done < len(history):
+            new_records = chain(history.records(done), row.buffer.records())
+        else:
+            new_records = row.buffer.records(done - len(history))
+        for type_code, amount, timestamp in new_records:
+            row.lines.append(f"{to_datetime(timestamp)}: {TX_TYPE_NAMES[type_code]} - ${amount:.2f}")
+
+    def _buffer_transaction(self, row: AccountRow, type_code: int, amount: float) -> None:
+        """
+        Buffers a transaction record for an account, flushing the buffer once it reaches the
+        threshold.
+
+        Parameters:
+        - row (AccountRow): The account the transaction belongs to.
+        - type_code (int): One of TX_DEPOSIT or TX_WITHDRAWAL.
+        - amount (float): The transaction amount.
+        """
+        buffer = row.buffer
+        buffer.append(type_code, amount, time.time_ns())
+        if len(buffer) >= self._BUF_THRESHOLD:
+            row.history.extend(buffer)
+            buffer.clear()
+
+    def flush(self) -> None:
+        """
+        Flushes all buffered transactions into the transaction history.
+        """
+        for row in self._rows.values():
+            if row.buffer:
+                row.history.extend(row.buffer)
+                row.buffer.clear()
 
 
 # Simple console interface
-def main():
+MAIN_MENU: str = (
+    "\n1. Open a new account\n"
+    "2. Access an existing account\n"
+    "3. Quit\n"
+    "Enter your choice (1/2/3): "
+)
+
+LOGGED_MENU: str = (
+    "\nLogged-in Menu:\n"
+    "1. Make a deposit\n"
+    "2. Make a withdrawal\n"
+    "3. View account balance\n"
+    "4. View transaction history\n"
+    "5. Log out\n"
+    "6. Quit\n"
+    "Enter your choice (1/2/3/4/5/6): "
+)
+
+
+def prompt(text: str) -> str:
     """
-    Main function to run the simple console-based banking system.
+    Writes a prompt in a single call and reads one line of input.
+
+    Parameters:
+    - text (str): The prompt to display.
+
+    Returns:
+    - str: The line entered, without the trailing newline.
     """
-    savings_account = SavingsAccount()
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
-    while True:
-        print("\n1. Open a new account")
-        print("2. Access an existing account")
-        print("3. Quit")
 
-        choice = input("Enter your choice (1/2/3): ")
+def open_account(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "Open a new account" menu choice.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store to open the account in.
 
-        if choice == "1":
-            name = input("Enter your name: ")
-            initial_deposit = float(input("Enter the initial deposit amount: "))
-            account_number = savings_account.open_new_account(name, initial_deposit)
-            print(f"\nAccount created successfully! Your account number is: {account_number}")
+    Returns:
+    - bool: True if the menu loop should stop, False otherwise.
+    """
+    name = prompt("Enter your name: ")
+    initial_deposit = float(prompt("Enter the initial deposit amount: "))
+    account_number = savings_account.open_new_account(name, initial_deposit)
+    account_str = savings_account.format_account_number(account_number)
+    print(f"\nAccount created successfully! Your account number is: {account_str}")
+    return False
 
-        elif choice == "2":
-            if savings_account.current_account_number is None:
-                account_number = int(input("Enter your account number: "))
-                account_info = savings_account.retrieve_account(account_number)
 
-                if account_info:
-                    savings_account.current_account_number = account_number
-                    print("\nAccount accessed successfully!")
+def access_account(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "Access an existing account" menu choice.
 
-                else:
-                    print("Account not found. Please check your account number.")
+    Parameters:
+    - savings_account (SavingsAccount): The account store to log in to.
 
-            else:
-                print(f"You are already logged in with account number {savings_account.current_account_number}")
+    Returns:
+    - bool: True if the menu loop should stop, False otherwise.
+    """
+    if savings_account.current_account_number is None:
+        account_number = int(prompt("Enter your account number: "))
+        account_info = savings_account.retrieve_account(account_number)
 
-        elif choice == "3":
-            print("Quitting the program.")
-            break
+        if account_info:
+            savings_account.current_account_number = account_number
+            print("\nAccount accessed successfully!")
 
         else:
-            print("Invalid choice. Please enter a valid option.")
-
-        # Sub-menu for logged-in users
-        while savings_account.current_account_number is not None:
-            print("\nLogged-in Menu:")
-            print("1. Make a deposit")
-            print("2. Make a withdrawal")
-            print("3. View account balance")
-            print("4. View transaction history")
-            print("5. Log out")
-            print("6. Quit")
-
-            sub_choice = input("Enter your choice (1/2/3/4/5/6): ")
-
-            if sub_choice == "1":
-                amount_deposit = float(input("Enter the deposit amount: "))
-                if savings_account.deposit(amount_deposit):
-                    print("Deposit successful!")
-                else:
-                    print("Error making deposit. Please try again.")
-
-            elif sub_choice == "2":
-                amount_withdraw = float(input("Enter the withdrawal amount: "))
-                if savings_account.withdraw(amount_withdraw):
-                    print("Withdrawal successful!")
-                else:
-                    print("Insufficient funds or error making withdrawal. Please try again.")
-
-            elif sub_choice == "3":
-                balance = savings_account.view_account_balance()
-                if balance is not None:
-                    print(f"Account Balance: ${balance:.2f}")
-                else:
-                    print("Error fetching account balance. Please try again.")
-
-            elif sub_choice == "4":
-                history = savings_account.view_transaction_history()
-                if history:
-                    print("\nTransaction History:")
-                    for transaction in history:
-                        print(f"{transaction['timestamp']}: {transaction['type']} - ${transaction['amount']:.2f}")
-                else:
-                    print("No transaction history available.")
-
-            elif sub_choice == "5":
-                savings_account.current_account_number = None
-                print("Logged out successfully!")
-                break
+            print("Account not found. Please check your account number.")
+
+    else:
+        account_str = savings_account.format_account_number(savings_account.current_account_number)
+        print(f"You are already logged in with account number {account_str}")
+    return False
+
+
+def quit_program(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "Quit" choice of the main menu.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store in use.
+
+    Returns:
+    - bool: True, as the menu loop should stop.
+    """
+    print("Quitting the program.")
+    return True
+
+
+def make_deposit(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "Make a deposit" menu choice.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store with the logged-in account.
+
+    Returns:
+    - bool: True if the menu loop should stop, False otherwise.
+    """
+    amount_deposit = float(prompt("Enter the deposit amount: "))
+    if savings_account.deposit(amount_deposit):
+        print("Deposit successful!")
+    else:
+        print("Error making deposit. Please try again.")
+    return False
+
+
+def make_withdrawal(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "Make a withdrawal" menu choice.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store with the logged-in account.
+
+    Returns:
+    - bool: True if the menu loop should stop, False otherwise.
+    """
+    amount_withdraw = float(prompt("Enter the withdrawal amount: "))
+    if savings_account.withdraw(amount_withdraw):
+        print("Withdrawal successful!")
+    else:
+        print("Insufficient funds or error making withdrawal. Please try again.")
+    return False
+
 
-            elif sub_choice == "6":
-                print("Quitting the program.")
-                exit()
+def show_balance(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "View account balance" menu choice.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store with the logged-in account.
+
+    Returns:
+    - bool: True if the menu loop should stop, False otherwise.
+    """
+    balance = savings_account.view_account_balance()
+    if balance is not None:
+        print(f"Account Balance: ${balance:.2f}")
+    else:
+        print("Error fetching account balance. Please try again.")
+    return False
+
+
+def show_transaction_history(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "View transaction history" menu choice.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store with the logged-in account.
+
+    Returns:
+    - bool: True if the menu loop should stop, False otherwise.
+    """
+    history = savings_account.view_transaction_lines()
+    if history:
+        print("\nTransaction History:")
+        print("\n".join(history))
+    else:
+        print("No transaction history available.")
+    return False
+
+
+def log_out(savings_account: SavingsAccount) -> bool:
+    """
+    Handles the "Log out" menu choice.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store with the logged-in account.
+
+    Returns:
+    - bool: True, as the logged-in menu loop should stop.
+    """
+    savings_account.flush()
+    savings_account.current_account_number = None
+    print("Logged out successfully!")
+    return True
+
+
+def quit_from_account(savings_account: SavingsAccount) -> NoReturn:
+    """
+    Handles the "Quit" choice of the logged-in menu by exiting the program.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store with the logged-in account.
+    """
+    savings_account.flush()
+    print("Quitting the program.")
+    sys.stdout.flush()
+    sys.exit(0)
+
+
+def invalid_choice(savings_account: SavingsAccount) -> bool:
+    """
+    Handles any menu choice that is not listed.
+
+    Parameters:
+    - savings_account (SavingsAccount): The account store in use.
+
+    Returns:
+    - bool: False, as the menu loop should continue.
+    """
+    print("Invalid choice. Please enter a valid option.")
+    return False
+
+
+# Menu choices mapped to their handlers
+MAIN_HANDLERS: dict[str, Callable[[SavingsAccount], bool]] = {
+    "1": open_account,
+    "2": access_account,
+    "3": quit_program,
+}
+
+LOGGED_HANDLERS: dict[str, Callable[[SavingsAccount], bool]] = {
+    "1": make_deposit,
+    "2": make_withdrawal,
+    "3": show_balance,
+    "4": show_transaction_history,
+    "5": log_out,
+    "6": quit_from_account,
+}
+
+
+def main() -> None:
+    """
+    Main function to run the simple console-based banking system.
+    """
+    savings_account = SavingsAccount()
+
+    # Bind the handler lookups once instead of resolving them on every menu iteration.
+    main_handler = MAIN_HANDLERS.get
+    logged_handler = LOGGED_HANDLERS.get
+
+    try:
+        while True:
+            choice = prompt(MAIN_MENU)
+            if main_handler(choice, invalid_choice)(savings_account):
+                break
 
-            else:
-                print("Invalid choice. Please enter a valid option.")
+            # Sub-menu for logged-in users
+            while savings_account.current_account_number is not None:
+                sub_choice = prompt(LOGGED_MENU)
+                if logged_handler(sub_choice, invalid_choice)(savings_account):
+                    break
+    finally:
+        # Make sure buffered transactions reach the history however the session ends.
+        savings_account.flush()
 
 
 if __name__ == "__main__":